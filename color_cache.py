@@ -1,6 +1,6 @@
 import logging
-from collections import OrderedDict
-from typing import Optional
+import time
+from typing import Hashable, Optional
 from color_extractor import ColorPalette
 
 logger = logging.getLogger('rhythm-hue.color-cache')
@@ -10,26 +10,33 @@ class ColorCache:
     LRU cache for storing extracted color palettes to improve performance
     """
 
-    def __init__(self, max_size: int = 128):
+    def __init__(self, max_size: int = 128, ttl_seconds: Optional[float] = None):
         """
-        Initialize cache with maximum size.
+        Initialize cache with maximum size and optional entry lifetime.
+
+        Entries older than ttl_seconds are dropped on access, so a palette
+        does not outlive replaced album art forever. None disables expiry.
         """
         if max_size < 1:
             raise ValueError("max_size must be at least 1")
+        if ttl_seconds is not None and ttl_seconds <= 0:
+            raise ValueError("ttl_seconds must be positive or None")
 
         self.max_size = max_size
-        self.cache = OrderedDict()  # Maintains insertion order for LRU
+        self.ttl_seconds = ttl_seconds
+        self.cache = {}  # Insertion-ordered dict doubles as the LRU list
         self.total_requests = 0
         self.total_hits = 0
 
-        logger.info(f"ColorCache initialized with max_size={max_size}")
+        logger.info("ColorCache initialized with max_size=%d", max_size)
 
-    def get(self, cache_key: str) -> Optional[ColorPalette]:
+    def get(self, cache_key: Hashable) -> Optional[ColorPalette]:
         """
         Retrieve cached palette.
 
         Args:
-            cache_key: MD5 hash of album+artist
+            cache_key: hashable album identifier (MusicBrainz id string or
+                metadata tuple)
 
         Returns:
             ColorPalette if cached, None otherwise
@@ -40,52 +47,61 @@ class ColorCache:
         self.total_requests += 1
 
         if cache_key in self.cache:
+            palette, stored_at = self.cache.pop(cache_key)
+
+            # Forget expired entries so stale palettes age out
+            if self.ttl_seconds is not None and time.monotonic() - stored_at > self.ttl_seconds:
+                logger.debug("Cache EXPIRE key %r", cache_key)
+                return None
+
             self.total_hits += 1
-            # Move to end (most recently used)
-            self.cache.move_to_end(cache_key)
-            logger.debug(f"Cache HIT for key {cache_key[:8]}...")
-            return self.cache[cache_key]
+            # Move to end (most recently used) via pop + reinsert
+            self.cache[cache_key] = (palette, stored_at)
+            logger.debug("Cache HIT for key %r", cache_key)
+            return palette
 
-        logger.debug(f"Cache MISS for key {cache_key[:8]}...")
+        logger.debug("Cache MISS for key %r", cache_key)
         return None
 
-    def put(self, cache_key: str, palette: ColorPalette) -> None:
+    def put(self, cache_key: Hashable, palette: ColorPalette) -> None:
         """
         Store palette in cache.
 
         Args:
-            cache_key: hash of album+artist
+            cache_key: hashable album identifier (MusicBrainz id string or
+                metadata tuple)
             palette: ColorPalette to cache
 
         Behavior:
             If cache is full, evicts least recently used entry
         """
         if cache_key in self.cache:
-            # Update existing entry
-            self.cache.move_to_end(cache_key)
-            self.cache[cache_key] = palette
-            logger.debug(f"Cache UPDATE for key {cache_key[:8]}...")
+            # Update existing entry, moving it to the most recent position
+            self.cache.pop(cache_key)
+            self.cache[cache_key] = (palette, time.monotonic())
+            logger.debug("Cache UPDATE for key %r", cache_key)
         else:
             # Add new entry
             if len(self.cache) >= self.max_size:
                 # Evict least recently used
                 evicted_key = next(iter(self.cache))
                 del self.cache[evicted_key]
-                logger.debug(f"Cache EVICT key {evicted_key[:8]}...")
+                logger.debug("Cache EVICT key %r", evicted_key)
 
-            self.cache[cache_key] = palette
-            logger.debug(f"Cache PUT key {cache_key[:8]}... (size={len(self.cache)})")
+            self.cache[cache_key] = (palette, time.monotonic())
+            logger.debug("Cache PUT key %r (size=%d)", cache_key, len(self.cache))
 
-    def invalidate(self, cache_key: str) -> None:
+    def invalidate(self, cache_key: Hashable) -> None:
         """
         Remove specific entry from cache.
 
         Args:
-            cache_key: MD5 hash of album+artist
+            cache_key: hashable album identifier (MusicBrainz id string or
+                metadata tuple)
         """
         if cache_key in self.cache:
             del self.cache[cache_key]
-            logger.debug(f"Cache INVALIDATE key {cache_key[:8]}...")
+            logger.debug("Cache INVALIDATE key %r", cache_key)
 
     def clear(self) -> None:
         """Empty entire cache."""
@@ -118,6 +134,6 @@ class ColorCache:
         """Return current cache size."""
         return len(self.cache)
 
-    def __contains__(self, cache_key: str) -> bool:
+    def __contains__(self, cache_key: Hashable) -> bool:
         """Check if key is in cache."""
         return cache_key in self.cache
@@ -3,18 +3,51 @@ This module handles extracting dominant colors from album art images and ensurin
 """
 
 import hashlib
+import io
 import logging
 import colorsys
+import os
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Tuple, Optional, Callable
+import numpy as np
 from PIL import Image
 from gi.repository import GObject
 
 logger = logging.getLogger('rhythm-hue.color-extractor')
 
+# Numba is optional: when available, the contrast-adjustment loop runs as a
+# compiled kernel; otherwise the pure-Python implementation is used
+try:
+    from numba import njit as _njit
+    _HAS_NUMBA = True
+except ImportError:
+    _HAS_NUMBA = False
+
+    def _njit(*args, **kwargs):
+        def wrap(func):
+            return func
+        return wrap
+
 # Type alias for RGB colors
 RGB = Tuple[int, int, int]
 
+# Local bindings for the contrast-adjustment inner loop: skips the module
+# attribute lookup per call, and multiplying by the reciprocal is cheaper
+# than three float divides
+_rgb_to_hsv = colorsys.rgb_to_hsv
+_hsv_to_rgb = colorsys.hsv_to_rgb
+_INV255 = 1.0 / 255.0
+
+# Precomputed sRGB -> linear lookup table for luminance calculation.
+# Avoids redoing the gamma expansion in Python for every channel of every
+# contrast check (adjust_for_contrast alone can call luminance dozens of times).
+_SRGB_LINEAR_LUT = np.where(
+    np.arange(256) / 255.0 <= 0.03928,
+    (np.arange(256) / 255.0) / 12.92,
+    ((np.arange(256) / 255.0 + 0.055) / 1.055) ** 2.4
+).astype(np.float32)
+
 @dataclass
 class ColorPalette:
     """
@@ -39,7 +72,7 @@ class ColorPalette:
                 raise ValueError(f"{color_name} RGB values must be in range [0, 255]")
 
         if self.contrast_ratio_bg_fg < 4.5:
-            logger.warning(f"Contrast ratio {self.contrast_ratio_bg_fg:.2f} below WCAG AA minimum (4.5)")
+            logger.warning("Contrast ratio %.2f below WCAG AA minimum (4.5)", self.contrast_ratio_bg_fg)
 
 
 def luminance(r: int, g: int, b: int) -> float:
@@ -52,17 +85,26 @@ def luminance(r: int, g: int, b: int) -> float:
     Returns:
         Relative luminance (0.0 - 1.0)
     """
-    def adjust(c: int) -> float:
-        c = c / 255.0
-        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+    return float(0.2126 * _SRGB_LINEAR_LUT[r] + 0.7152 * _SRGB_LINEAR_LUT[g] + 0.0722 * _SRGB_LINEAR_LUT[b])
+
 
-    return 0.2126 * adjust(r) + 0.7152 * adjust(g) + 0.0722 * adjust(b)
+@lru_cache(maxsize=4096)
+def _contrast_ratio_cached(packed1: int, packed2: int) -> float:
+    """Compute contrast ratio from two 24-bit packed RGB ints (memoized)."""
+    l1 = luminance((packed1 >> 16) & 0xff, (packed1 >> 8) & 0xff, packed1 & 0xff)
+    l2 = luminance((packed2 >> 16) & 0xff, (packed2 >> 8) & 0xff, packed2 & 0xff)
+    lighter = max(l1, l2)
+    darker = min(l1, l2)
+    return (lighter + 0.05) / (darker + 0.05)
 
 
 def contrast_ratio(rgb1: RGB, rgb2: RGB) -> float:
     """
     Calculate WCAG contrast ratio between two colors.
 
+    Results are memoized by packed color pair, since adjust_for_contrast
+    probes the same pairs repeatedly across similar palettes.
+
     Args:
         rgb1: First RGB color
         rgb2: Second RGB color
@@ -70,18 +112,140 @@ def contrast_ratio(rgb1: RGB, rgb2: RGB) -> float:
     Returns:
         Contrast ratio (1.0 - 21.0)
     """
-    l1 = luminance(*rgb1)
-    l2 = luminance(*rgb2)
+    packed1 = (rgb1[0] << 16) | (rgb1[1] << 8) | rgb1[2]
+    packed2 = (rgb2[0] << 16) | (rgb2[1] << 8) | rgb2[2]
+    # The ratio is symmetric, so normalize the key order for better hit rates
+    if packed1 > packed2:
+        packed1, packed2 = packed2, packed1
+    return _contrast_ratio_cached(packed1, packed2)
+
+
+@_njit(cache=True, fastmath=True)
+def _srgb_linear_f(c: float) -> float:
+    """Scalar sRGB -> linear transform for the JIT kernel (c in 0-255)."""
+    x = c / 255.0
+    if x <= 0.03928:
+        return x / 12.92
+    return ((x + 0.055) / 1.055) ** 2.4
+
+
+@_njit(cache=True, fastmath=True)
+def _contrast_ratio_f(r1: float, g1: float, b1: float,
+                      r2: float, g2: float, b2: float) -> float:
+    """Scalar WCAG contrast ratio for the JIT kernel."""
+    l1 = 0.2126 * _srgb_linear_f(r1) + 0.7152 * _srgb_linear_f(g1) + 0.0722 * _srgb_linear_f(b1)
+    l2 = 0.2126 * _srgb_linear_f(r2) + 0.7152 * _srgb_linear_f(g2) + 0.0722 * _srgb_linear_f(b2)
     lighter = max(l1, l2)
     darker = min(l1, l2)
     return (lighter + 0.05) / (darker + 0.05)
 
 
+@_njit(cache=True, fastmath=True)
+def _hsv_to_rgb_f(h: float, s: float, v: float) -> Tuple[float, float, float]:
+    """Scalar HSV -> RGB (0-1 range) for the JIT kernel; mirrors colorsys."""
+    if s == 0.0:
+        return v, v, v
+    i = int(h * 6.0)
+    f = (h * 6.0) - i
+    p = v * (1.0 - s)
+    q = v * (1.0 - s * f)
+    t = v * (1.0 - s * (1.0 - f))
+    i = i % 6
+    if i == 0:
+        return v, t, p
+    if i == 1:
+        return q, v, p
+    if i == 2:
+        return p, v, t
+    if i == 3:
+        return p, q, v
+    if i == 4:
+        return t, p, v
+    return v, p, q
+
+
+@_njit(cache=True, fastmath=True)
+def _adjust_kernel(fr: float, fg_c: float, fb: float,
+                   br: float, bg_c: float, bb: float,
+                   min_ratio: float) -> Tuple[float, float, float, float, float, float]:
+    """
+    Compiled contrast-adjustment loop.
+
+    Takes foreground/background RGB as 0-255 floats and returns the adjusted
+    pair the same way. Mirrors the pure-Python implementation below.
+    """
+    # Inline rgb_to_hsv; only saturation/value of fg and value of bg are needed
+    fmax = max(fr, max(fg_c, fb)) / 255.0
+    fmin = min(fr, min(fg_c, fb)) / 255.0
+    fg_v = fmax
+    fg_s = 0.0 if fmax == 0.0 else (fmax - fmin) / fmax
+    fg_h = 0.0
+    if fmax != fmin:
+        rc = (fmax - fr / 255.0) / (fmax - fmin)
+        gc = (fmax - fg_c / 255.0) / (fmax - fmin)
+        bc = (fmax - fb / 255.0) / (fmax - fmin)
+        if fr / 255.0 == fmax:
+            fg_h = bc - gc
+        elif fg_c / 255.0 == fmax:
+            fg_h = 2.0 + rc - bc
+        else:
+            fg_h = 4.0 + gc - rc
+        fg_h = (fg_h / 6.0) % 1.0
+
+    bmax = max(br, max(bg_c, bb)) / 255.0
+    bmin = min(br, min(bg_c, bb)) / 255.0
+    bg_v = bmax
+    bg_s = 0.0 if bmax == 0.0 else (bmax - bmin) / bmax
+    bg_h = 0.0
+    if bmax != bmin:
+        rc = (bmax - br / 255.0) / (bmax - bmin)
+        gc = (bmax - bg_c / 255.0) / (bmax - bmin)
+        bc = (bmax - bb / 255.0) / (bmax - bmin)
+        if br / 255.0 == bmax:
+            bg_h = bc - gc
+        elif bg_c / 255.0 == bmax:
+            bg_h = 2.0 + rc - bc
+        else:
+            bg_h = 4.0 + gc - rc
+        bg_h = (bg_h / 6.0) % 1.0
+
+    if fg_v > bg_v:
+        # Foreground is lighter - lighten it more
+        for _ in range(20):
+            fg_v = min(1.0, fg_v + 0.05)
+            r, g, b = _hsv_to_rgb_f(fg_h, fg_s, fg_v)
+            ar, ag, ab = float(int(r * 255)), float(int(g * 255)), float(int(b * 255))
+            if _contrast_ratio_f(ar, ag, ab, br, bg_c, bb) >= min_ratio:
+                return ar, ag, ab, br, bg_c, bb
+    else:
+        # Background is lighter - lighten fg or darken bg
+        for _ in range(20):
+            fg_v = min(1.0, fg_v + 0.05)
+            r, g, b = _hsv_to_rgb_f(fg_h, fg_s, fg_v)
+            ar, ag, ab = float(int(r * 255)), float(int(g * 255)), float(int(b * 255))
+            if _contrast_ratio_f(ar, ag, ab, br, bg_c, bb) >= min_ratio:
+                return ar, ag, ab, br, bg_c, bb
+
+        # If lightening fg didn't work, try darkening bg
+        for _ in range(20):
+            bg_v = max(0.0, bg_v - 0.05)
+            r, g, b = _hsv_to_rgb_f(bg_h, bg_s, bg_v)
+            ar, ag, ab = float(int(r * 255)), float(int(g * 255)), float(int(b * 255))
+            if _contrast_ratio_f(fr, fg_c, fb, ar, ag, ab) >= min_ratio:
+                return fr, fg_c, fb, ar, ag, ab
+
+    # Fallback: default foreground based on (possibly darkened) bg lightness
+    if bg_v > 0.5:
+        return 40.0, 40.0, 40.0, br, bg_c, bb
+    return 245.0, 245.0, 245.0, br, bg_c, bb
+
+
 def adjust_for_contrast(fg: RGB, bg: RGB, min_ratio: float = 4.5) -> Tuple[RGB, RGB]:
     """
     Adjust foreground/background colors to meet minimum contrast ratio.
 
     Preserves hue and saturation as much as possible while adjusting lightness.
+    Uses a Numba-compiled kernel when available, otherwise pure Python.
 
     Args:
         fg: Foreground color (text)
@@ -96,18 +260,31 @@ def adjust_for_contrast(fg: RGB, bg: RGB, min_ratio: float = 4.5) -> Tuple[RGB,
     if current_ratio >= min_ratio:
         return fg, bg
 
-    logger.debug(f"Adjusting contrast from {current_ratio:.2f} to meet {min_ratio}")
+    logger.debug("Adjusting contrast from %.2f to meet %s", current_ratio, min_ratio)
+
+    if _HAS_NUMBA:
+        result = _adjust_kernel(float(fg[0]), float(fg[1]), float(fg[2]),
+                                float(bg[0]), float(bg[1]), float(bg[2]),
+                                float(min_ratio))
+        adjusted_fg = (int(result[0]), int(result[1]), int(result[2]))
+        adjusted_bg = (int(result[3]), int(result[4]), int(result[5]))
+        return adjusted_fg, adjusted_bg
+
+    return _adjust_for_contrast_py(fg, bg, min_ratio)
+
 
+def _adjust_for_contrast_py(fg: RGB, bg: RGB, min_ratio: float) -> Tuple[RGB, RGB]:
+    """Pure-Python fallback for adjust_for_contrast when Numba is missing."""
     # Convert to HSV for easier lightness adjustment
-    fg_h, fg_s, fg_v = colorsys.rgb_to_hsv(fg[0]/255, fg[1]/255, fg[2]/255)
-    bg_h, bg_s, bg_v = colorsys.rgb_to_hsv(bg[0]/255, bg[1]/255, bg[2]/255)
+    fg_h, fg_s, fg_v = _rgb_to_hsv(fg[0]*_INV255, fg[1]*_INV255, fg[2]*_INV255)
+    bg_h, bg_s, bg_v = _rgb_to_hsv(bg[0]*_INV255, bg[1]*_INV255, bg[2]*_INV255)
 
     # Determine which is lighter
     if fg_v > bg_v:
         # Foreground is lighter - lighten it more
         for i in range(20):
             fg_v = min(1.0, fg_v + 0.05)
-            adjusted_fg_rgb = colorsys.hsv_to_rgb(fg_h, fg_s, fg_v)
+            adjusted_fg_rgb = _hsv_to_rgb(fg_h, fg_s, fg_v)
             adjusted_fg = tuple(int(c * 255) for c in adjusted_fg_rgb)
 
             if contrast_ratio(adjusted_fg, bg) >= min_ratio:
@@ -116,7 +293,7 @@ def adjust_for_contrast(fg: RGB, bg: RGB, min_ratio: float = 4.5) -> Tuple[RGB,
         # Background is lighter - lighten fg or darken bg
         for i in range(20):
             fg_v = min(1.0, fg_v + 0.05)
-            adjusted_fg_rgb = colorsys.hsv_to_rgb(fg_h, fg_s, fg_v)
+            adjusted_fg_rgb = _hsv_to_rgb(fg_h, fg_s, fg_v)
             adjusted_fg = tuple(int(c * 255) for c in adjusted_fg_rgb)
 
             if contrast_ratio(adjusted_fg, bg) >= min_ratio:
@@ -125,61 +302,76 @@ def adjust_for_contrast(fg: RGB, bg: RGB, min_ratio: float = 4.5) -> Tuple[RGB,
         # If lightening fg didn't work, try darkening bg
         for i in range(20):
             bg_v = max(0.0, bg_v - 0.05)
-            adjusted_bg_rgb = colorsys.hsv_to_rgb(bg_h, bg_s, bg_v)
+            adjusted_bg_rgb = _hsv_to_rgb(bg_h, bg_s, bg_v)
             adjusted_bg = tuple(int(c * 255) for c in adjusted_bg_rgb)
 
             if contrast_ratio(fg, adjusted_bg) >= min_ratio:
                 return fg, adjusted_bg
 
     # Fallback: use appropriate default foreground based on background lightness
-    logger.warning(f"Could not achieve contrast ratio {min_ratio}, using default foreground")
+    logger.warning("Could not achieve contrast ratio %s, using default foreground", min_ratio)
 
     # If background is light (lightness > 0.5), use dark foreground
     # If background is dark (lightness <= 0.5), use light foreground
     if bg_v > 0.5:
         # Light background - use dark charcoal foreground
         default_fg = (40, 40, 40)
-        logger.debug(f"Light background detected, using dark foreground {default_fg}")
+        logger.debug("Light background detected, using dark foreground %s", default_fg)
     else:
         # Dark background - use off-white foreground
         default_fg = (245, 245, 245)
-        logger.debug(f"Dark background detected, using light foreground {default_fg}")
+        logger.debug("Dark background detected, using light foreground %s", default_fg)
 
     final_ratio = contrast_ratio(default_fg, bg)
-    logger.debug(f"Fallback contrast ratio: {final_ratio:.2f}")
+    logger.debug("Fallback contrast ratio: %.2f", final_ratio)
 
     return default_fg, bg
 
 
-def extract_dominant_colors(image_path: str, num_colors: int = 15) -> list[RGB]:
+def _quantize_image(img: Image.Image, num_colors: int) -> list[RGB]:
     """
-    Extract dominant colors from an image using quantization.
+    Extract dominant colors from an already-opened image using quantization.
 
     Args:
-        image_path: Absolute path to image file
-        num_colors: Number of dominant colors to extract (default 15)
+        img: Open PIL image (not modified; resized copy is quantized)
+        num_colors: Number of dominant colors to extract
 
     Returns:
         List of RGB tuples representing dominant colors
     """
-    # Load and resize image for performance
-    img = Image.open(image_path)
-    img = img.resize((150, 150))
-    img = img.convert('RGB')
-
-    # Extract dominant colors using quantization
-    palette_img = img.quantize(colors=num_colors)
+    # Palette extraction needs no anti-aliasing, so downsample aggressively
+    # with the cheapest filter; skip the RGB conversion when already RGB
+    if img.mode != 'RGB':
+        img = img.convert('RGB')
+    img = img.resize((100, 100), Image.Resampling.NEAREST)
+
+    # Extract dominant colors using fast octree quantization
+    palette_img = img.quantize(colors=num_colors, method=Image.Quantize.FASTOCTREE)
     palette = palette_img.getpalette()
 
-    # Extract RGB colors
-    all_colors = []
-    for i in range(num_colors):
-        r = palette[i * 3]
-        g = palette[i * 3 + 1]
-        b = palette[i * 3 + 2]
-        all_colors.append((r, g, b))
+    # Extract RGB colors in one vectorized pass instead of per-index slicing.
+    # FASTOCTREE zero-pads the palette up to the requested count, so keep
+    # only the entries the quantized image actually references - otherwise
+    # low-color art (solid or two-tone covers) picks up spurious black
+    # swatches that hijack the darkest-color selection
+    used = sorted(index for _, index in palette_img.getcolors())
+    arr = np.asarray(palette, dtype=np.uint8).reshape(-1, 3)[used]
+    return [tuple(row) for row in arr.tolist()]
+
+
+def extract_dominant_colors(image_path: str, num_colors: int = 15) -> list[RGB]:
+    """
+    Extract dominant colors from an image file using quantization.
+
+    Args:
+        image_path: Absolute path to image file
+        num_colors: Number of dominant colors to extract (default 15)
 
-    return all_colors
+    Returns:
+        List of RGB tuples representing dominant colors
+    """
+    with Image.open(image_path) as img:
+        return _quantize_image(img, num_colors)
 
 
 def filter_distinct_colors(colors: list[RGB], max_count: int = 8, min_distance: float = 30) -> list[RGB]:
@@ -197,29 +389,70 @@ def filter_distinct_colors(colors: list[RGB], max_count: int = 8, min_distance:
     if not colors:
         return []
 
-    def color_distance(c1: RGB, c2: RGB) -> float:
-        return sum((a - b) ** 2 for a, b in zip(c1, c2)) ** 0.5
+    # Work on an int32 array so squared channel differences can't overflow,
+    # and compare squared distances to avoid a sqrt per candidate pair
+    candidates = np.asarray(colors, dtype=np.int32)
+    min_distance_sq = min_distance * min_distance
 
     # Start with first color
     distinct_colors = [colors[0]]
+    accepted = candidates[:1]
 
     # Add colors that are sufficiently different from existing ones
-    for color in colors[1:]:
-        if all(color_distance(color, existing) > min_distance for existing in distinct_colors):
-            distinct_colors.append(color)
+    for i in range(1, len(colors)):
         if len(distinct_colors) >= max_count:
             break
+        diff = accepted - candidates[i]
+        if (diff * diff).sum(axis=1).min() > min_distance_sq:
+            distinct_colors.append(colors[i])
+            accepted = np.vstack((accepted, candidates[i]))
 
     # If we don't have sufficient distinct colors, pad with remaining colors
+    # (set membership instead of a linear scan per candidate)
+    seen = set(distinct_colors)
     for color in colors:
-        if color not in distinct_colors:
-            distinct_colors.append(color)
         if len(distinct_colors) >= max_count:
             break
+        if color not in seen:
+            seen.add(color)
+            distinct_colors.append(color)
 
     return distinct_colors[:max_count]
 
 
+def _rgb_to_hsv_array(rgb_arr) -> np.ndarray:
+    """
+    Convert an (N, 3) array of RGB colors to HSV in a single vectorized pass.
+
+    Args:
+        rgb_arr: Array-like of shape (N, 3) with RGB values in [0, 255]
+
+    Returns:
+        (N, 3) float32 array of (hue, saturation, value), each in [0.0, 1.0]
+    """
+    arr = np.asarray(rgb_arr, dtype=np.float32) / 255.0
+    r, g, b = arr[:, 0], arr[:, 1], arr[:, 2]
+
+    maxc = arr.max(axis=1)
+    minc = arr.min(axis=1)
+    v = maxc
+    delta = maxc - minc
+
+    # Guard divisions against grey/black pixels (delta or maxc of zero)
+    safe_max = np.where(maxc == 0, 1.0, maxc)
+    safe_delta = np.where(delta == 0, 1.0, delta)
+
+    s = np.where(maxc == 0, 0.0, delta / safe_max)
+
+    h = np.where(
+        maxc == r, (g - b) / safe_delta,
+        np.where(maxc == g, 2.0 + (b - r) / safe_delta, 4.0 + (r - g) / safe_delta)
+    )
+    h = np.where(delta == 0, 0.0, (h / 6.0) % 1.0)
+
+    return np.stack([h, s, v], axis=1).astype(np.float32)
+
+
 def get_saturation(rgb: RGB) -> float:
     """
     Calculate the saturation value of an RGB color.
@@ -230,7 +463,7 @@ def get_saturation(rgb: RGB) -> float:
     Returns:
         Saturation value (0.0 - 1.0)
     """
-    _, s, _ = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
+    _, s, _ = _rgb_to_hsv(rgb[0]*_INV255, rgb[1]*_INV255, rgb[2]*_INV255)
     return s
 
 
@@ -244,7 +477,7 @@ def get_lightness(rgb: RGB) -> float:
     Returns:
         Lightness value (0.0 - 1.0)
     """
-    _, _, v = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
+    _, _, v = _rgb_to_hsv(rgb[0]*_INV255, rgb[1]*_INV255, rgb[2]*_INV255)
     return v
 
 
@@ -258,7 +491,7 @@ def is_vibrant_and_visible(rgb: RGB) -> bool:
     Returns:
         True if color has both sufficient saturation and lightness
     """
-    _, s, v = colorsys.rgb_to_hsv(rgb[0]/255, rgb[1]/255, rgb[2]/255)
+    _, s, v = _rgb_to_hsv(rgb[0]*_INV255, rgb[1]*_INV255, rgb[2]*_INV255)
     return s > 0.2 and v > 0.2  # Must have both saturation and lightness
 
 
@@ -266,6 +499,9 @@ def extract_colors_sync(image_path: str) -> Optional[ColorPalette]:
     """
     Synchronously extract color palette from album art.
 
+    Results are memoized by (path, mtime), so repeated extractions of the
+    same unchanged file are free while re-downloaded art is picked up.
+
     Args:
         image_path: Absolute path to album art image file
 
@@ -273,89 +509,142 @@ def extract_colors_sync(image_path: str) -> Optional[ColorPalette]:
         ColorPalette or None on failure
     """
     try:
-        colors = extract_dominant_colors(image_path, num_colors=15)
-        # logger.info(f"Initial extracted colors (by frequency): {colors}")
-
-        # Before filtering, identify the absolute darkest and lightest colors
-        # These are critical for background/foreground and should be preserved
-        darkest = min(colors, key=get_lightness)
-        lightest = max(colors, key=get_lightness)
-
-        colors = filter_distinct_colors(colors, max_count=8, min_distance=30)
-
-        # Ensure darkest and lightest are in the filtered list
-        if darkest not in colors:
-            colors.insert(0, darkest)
-        if lightest not in colors:
-            colors.append(lightest)
-
-        # logger.info(f"After filtering to distinct colors: {colors}")
-
-        # Sort by saturation to find vibrant colors
-        colors_by_saturation = sorted(colors, key=get_saturation, reverse=True)
-        # logger.info(f"Colors by saturation (high to low): {[(c, f'{get_saturation(c):.3f}') for c in colors_by_saturation]}")
-
-        # Sort by lightness to find darkest/lightest
-        colors_by_lightness = sorted(colors, key=get_lightness)
-        # logger.info(f"Colors by lightness (low to high): {[(c, f'{get_lightness(c):.3f}') for c in colors_by_lightness]}")
-
-        background = colors_by_lightness[0]  # Darkest (guaranteed to be true darkest now)
-        foreground = colors_by_lightness[-1]  # Lightest (guaranteed to be true lightest now)
-        
-        # Ensure contrast compliance
-        foreground, background = adjust_for_contrast(foreground, background, min_ratio=4.5)
-
-        # Primary should be vibrant AND visible (not too dark)
-        # Filter out colors that are too dark (lightness < 0.2) as they appear black even if they have high saturation
-        vibrant_colors = [c for c in colors_by_saturation if is_vibrant_and_visible(c)]
-        # logger.info(vibrant_colors)
-        
-        # Pick primary from vibrant visible colors, avoiding background
-        if vibrant_colors:
-            primary = vibrant_colors[0]
-            if primary == background and len(vibrant_colors) > 1:
-                primary = vibrant_colors[1]
-        else:
-            # Fallback to most saturated if no vibrant colors found
-            primary = colors_by_saturation[0]
-            if primary == background and len(colors_by_saturation) > 1:
-                primary = colors_by_saturation[1]
-
-        # Secondary and accent should also be vibrant and distinct
-        secondary = vibrant_colors[1] if len(vibrant_colors) > 1 else primary
-        if secondary == background and len(vibrant_colors) > 2:
-                secondary = vibrant_colors[2]
-
-        accent = vibrant_colors[2] if len(vibrant_colors) > 2 else primary
-        if accent == background and len(vibrant_colors) > 3:
-            accent = vibrant_colors[3]
-        
-        # Calculate contrast ratio
-        ratio = contrast_ratio(foreground, background)
-
-        # Generate cache key
-        cache_key = hashlib.md5(image_path.encode()).hexdigest()
-
-        # logger.info({ 'primary': primary, 'secondary': secondary, 'background': background, 'foreground': foreground, 'accent': accent })
-        return ColorPalette(
-            primary=primary,
-            secondary=secondary,
-            background=background,
-            foreground=foreground,
-            accent=accent,
-            contrast_ratio_bg_fg=ratio,
-            source_hash=cache_key
-        )
+        mtime = os.path.getmtime(image_path)
+    except OSError:
+        logger.error("Image file not found: %s", image_path)
+        return None
+
+    return _extract_colors_cached(image_path, mtime)
+
+
+@lru_cache(maxsize=128)
+def _extract_colors_cached(image_path: str, mtime: float) -> Optional[ColorPalette]:
+    """Heavy extraction body behind the (path, mtime) memoization layer."""
+    try:
+        # Decode the file exactly once and share the handle with all passes
+        with Image.open(image_path) as img:
+            img.load()
+            # Source hash is just an identifier, so use the fastest hash
+            source_hash = hashlib.blake2b(image_path.encode(), digest_size=8).hexdigest()
+            return _palette_from_image(img, source_hash)
 
     except FileNotFoundError:
-        logger.error(f"Image file not found: {image_path}")
+        logger.error("Image file not found: %s", image_path)
         return None
     except Exception as e:
-        logger.error(f"Error extracting colors from {image_path}: {e}", exc_info=True)
+        logger.error("Error extracting colors from %s: %s", image_path, e, exc_info=True)
         return None
 
 
-def extract_colors_async(image_path: str, callback: Callable[[Optional[ColorPalette]], None]) -> None:
+def extract_colors_from_bytes(image_bytes: bytes) -> Optional[ColorPalette]:
+    """
+    Synchronously extract color palette from in-memory image data.
+
+    Used for embedded album art, where the bytes are already in hand and a
+    temp-file round trip (encode, write, re-open, decode) would be wasted.
+
+    Args:
+        image_bytes: Raw encoded image data (JPEG/PNG/etc.)
+
+    Returns:
+        ColorPalette or None on failure
+    """
+    try:
+        with Image.open(io.BytesIO(image_bytes)) as img:
+            img.load()
+            source_hash = hashlib.blake2b(image_bytes, digest_size=8).hexdigest()
+            return _palette_from_image(img, source_hash)
+
+    except Exception as e:
+        logger.error("Error extracting colors from image data: %s", e, exc_info=True)
+        return None
+
+
+def _palette_from_image(img: Image.Image, source_hash: str) -> ColorPalette:
+    """Build a ColorPalette from a decoded image (shared by both entrypoints)."""
+    colors = _quantize_image(img, num_colors=15)
+    # logger.info(f"Initial extracted colors (by frequency): {colors}")
+
+    # Before filtering, identify the absolute darkest and lightest colors
+    # These are critical for background/foreground and should be preserved.
+    # HSV value is just the max channel, so one vectorized max/argmin pass
+    # replaces two Python traversals through colorsys
+    values = np.asarray(colors, dtype=np.uint8).max(axis=1)
+    darkest = colors[int(values.argmin())]
+    lightest = colors[int(values.argmax())]
+
+    colors = filter_distinct_colors(colors, max_count=8, min_distance=30)
+
+    # Ensure darkest and lightest are in the filtered list
+    if darkest not in colors:
+        colors.insert(0, darkest)
+    if lightest not in colors:
+        colors.append(lightest)
+
+    # logger.info(f"After filtering to distinct colors: {colors}")
+
+    # Convert all filtered colors to HSV once; saturation/lightness sorts and
+    # the vibrancy mask below all reuse the same array instead of calling
+    # colorsys per color per pass
+    hsv = _rgb_to_hsv_array(colors)
+
+    # Sort by saturation to find vibrant colors (stable sort keeps tie order)
+    sat_order = np.argsort(-hsv[:, 1], kind='stable')
+    colors_by_saturation = [colors[i] for i in sat_order]
+
+    # Sort by lightness to find darkest/lightest
+    light_order = np.argsort(hsv[:, 2], kind='stable')
+    colors_by_lightness = [colors[i] for i in light_order]
+
+    background = colors_by_lightness[0]  # Darkest (guaranteed to be true darkest now)
+    foreground = colors_by_lightness[-1]  # Lightest (guaranteed to be true lightest now)
+
+    # Ensure contrast compliance
+    foreground, background = adjust_for_contrast(foreground, background, min_ratio=4.5)
+
+    # Primary should be vibrant AND visible (not too dark)
+    # Filter out colors that are too dark (lightness < 0.2) as they appear black even if they have high saturation
+    vibrant_mask = (hsv[:, 1] > 0.2) & (hsv[:, 2] > 0.2)
+    vibrant_colors = [colors[i] for i in sat_order if vibrant_mask[i]]
+    # logger.info(vibrant_colors)
+    
+    # Pick primary from vibrant visible colors, avoiding background
+    if vibrant_colors:
+        primary = vibrant_colors[0]
+        if primary == background and len(vibrant_colors) > 1:
+            primary = vibrant_colors[1]
+    else:
+        # Fallback to most saturated if no vibrant colors found
+        primary = colors_by_saturation[0]
+        if primary == background and len(colors_by_saturation) > 1:
+            primary = colors_by_saturation[1]
+
+    # Secondary and accent should also be vibrant and distinct
+    secondary = vibrant_colors[1] if len(vibrant_colors) > 1 else primary
+    if secondary == background and len(vibrant_colors) > 2:
+            secondary = vibrant_colors[2]
+
+    accent = vibrant_colors[2] if len(vibrant_colors) > 2 else primary
+    if accent == background and len(vibrant_colors) > 3:
+        accent = vibrant_colors[3]
+    
+    # Calculate contrast ratio
+    ratio = contrast_ratio(foreground, background)
+
+    # logger.info({ 'primary': primary, 'secondary': secondary, 'background': background, 'foreground': foreground, 'accent': accent })
+    return ColorPalette(
+        primary=primary,
+        secondary=secondary,
+        background=background,
+        foreground=foreground,
+        accent=accent,
+        contrast_ratio_bg_fg=ratio,
+        source_hash=source_hash
+    )
+
+
+def extract_colors_async(image_path: str, callback: Callable[[Optional[ColorPalette]], None],
+                         executor=None) -> None:
     """
     Asynchronously extract color palette from album art.
 
@@ -364,6 +653,8 @@ def extract_colors_async(image_path: str, callback: Callable[[Optional[ColorPale
     Args:
         image_path: Absolute path to album art image file
         callback: Function to call with extracted ColorPalette (or None on failure)
+        executor: Optional concurrent.futures.Executor to run the extraction
+            on; when None, a one-off daemon thread is spawned as before
     """
     def run_extraction():
         """Extract colors in background."""
@@ -372,7 +663,42 @@ def extract_colors_async(image_path: str, callback: Callable[[Optional[ColorPale
         # Call callback on main thread
         GObject.idle_add(lambda: callback(palette) or False)
 
+    if executor is not None:
+        # Reuse the caller's worker instead of paying thread startup per song
+        executor.submit(run_extraction)
+        return
+
     # Run in background thread via GObject
     import threading
     thread = threading.Thread(target=run_extraction, daemon=True)
     thread.start()
+
+
+def extract_colors_async_from_bytes(image_bytes: bytes,
+                                    callback: Callable[[Optional[ColorPalette]], None],
+                                    executor=None) -> None:
+    """
+    Asynchronously extract color palette from in-memory image data.
+
+    Runs extraction in background and calls callback with result on main thread.
+
+    Args:
+        image_bytes: Raw encoded image data (JPEG/PNG/etc.)
+        callback: Function to call with extracted ColorPalette (or None on failure)
+        executor: Optional concurrent.futures.Executor to run the extraction
+            on; when None, a one-off daemon thread is spawned as before
+    """
+    def run_extraction():
+        """Extract colors in background."""
+        palette = extract_colors_from_bytes(image_bytes)
+
+        # Call callback on main thread
+        GObject.idle_add(lambda: callback(palette) or False)
+
+    if executor is not None:
+        executor.submit(run_extraction)
+        return
+
+    import threading
+    thread = threading.Thread(target=run_extraction, daemon=True)
+    thread.start()
@@ -4,23 +4,54 @@ Configuration management for Rhythm-Hue plugin.
 This module provides configuration values for the plugin with GSettings persistence.
 """
 
-from typing import Any
+import re
+from typing import Any, ClassVar, Optional
 from gi.repository import Gio
 
+# Precompiled matcher for '#rrggbb' colors; bound to fullmatch so validation
+# is a single C-level call with no exception machinery
+_HEX_COLOR_FULLMATCH = re.compile(r'#[0-9a-fA-F]{6}').fullmatch
+
+
+def _hex_to_rgb(color: str) -> tuple:
+    """Parse '#rrggbb' into an (r, g, b) tuple via a single C-level call."""
+    return tuple(bytes.fromhex(color[1:]))
+
 
 class PluginConfiguration:
     """Manages plugin settings with GSettings persistence."""
 
     GSETTINGS_SCHEMA = 'org.gnome.rhythmbox.plugins.rhythmbox-dynamic-theme'
 
+    # GSettings keys for the default palette with their hardcoded fallbacks
+    DEFAULT_COLOR_KEYS = (
+        ('default-primary', '#9e0d43'),
+        ('default-secondary', '#305b82'),
+        ('default-background', '#04040a'),
+        ('default-foreground', '#f0f0f0'),
+        ('default-accent', '#9e0d43'),
+    )
+
+    # Single Gio.Settings shared across instances: schema lookup and backend
+    # binding are expensive, and the plugin constructs configuration both on
+    # activation and when the preferences dialog opens
+    _shared_settings: ClassVar[Optional[Gio.Settings]] = None
+
+    @classmethod
+    def _get_settings(cls) -> Optional[Gio.Settings]:
+        """Return the memoized Gio.Settings, creating it on first use."""
+        if cls._shared_settings is None:
+            try:
+                cls._shared_settings = Gio.Settings.new(cls.GSETTINGS_SCHEMA)
+            except Exception:
+                # Fallback if GSettings schema is not installed
+                cls._shared_settings = None
+        return cls._shared_settings
+
     def __init__(self):
         """Initialize configuration with default values and GSettings."""
-        # Initialize GSettings
-        try:
-            self._settings = Gio.Settings.new(self.GSETTINGS_SCHEMA)
-        except Exception:
-            # Fallback if GSettings schema is not installed
-            self._settings = None
+        # Initialize GSettings (shared across instances)
+        self._settings = self._get_settings()
 
         # Configuration values (hardcoded, not persisted)
         self._color_intensity: float = 1.0
@@ -33,19 +64,20 @@ class PluginConfiguration:
         self._debounce_delay: float = 0.3
 
         # Default palette colors (fallback when album art is missing)
-        # Load from GSettings or use hardcoded defaults
+        # Load from GSettings or use hardcoded defaults. Reads are served
+        # from dconf's client-side cache, so no batching is needed here.
         if self._settings:
-            self._default_primary: str = self._settings.get_string('default-primary')
-            self._default_secondary: str = self._settings.get_string('default-secondary')
-            self._default_background: str = self._settings.get_string('default-background')
-            self._default_foreground: str = self._settings.get_string('default-foreground')
-            self._default_accent: str = self._settings.get_string('default-accent')
+            values = [self._settings.get_string(key) for key, _ in self.DEFAULT_COLOR_KEYS]
         else:
-            self._default_primary: str = '#9e0d43'
-            self._default_secondary: str = '#305b82'
-            self._default_background: str = '#04040a'
-            self._default_foreground: str = '#f0f0f0'
-            self._default_accent: str = '#9e0d43'
+            values = [fallback for _, fallback in self.DEFAULT_COLOR_KEYS]
+
+        (self._default_primary, self._default_secondary, self._default_background,
+         self._default_foreground, self._default_accent) = values
+
+        # Parse the hex strings once; theming reads the RGB tuples directly
+        (self._default_primary_rgb, self._default_secondary_rgb,
+         self._default_background_rgb, self._default_foreground_rgb,
+         self._default_accent_rgb) = (_hex_to_rgb(v) for v in values)
 
     @property
     def color_intensity(self) -> float:
@@ -140,6 +172,7 @@ class PluginConfiguration:
         if not self._is_valid_hex_color(value):
             raise ValueError("default_primary must be a valid hex color (e.g., '#9e0d43')")
         self._default_primary = value
+        self._default_primary_rgb = _hex_to_rgb(value)
         if self._settings:
             self._settings.set_string('default-primary', value)
 
@@ -153,6 +186,7 @@ class PluginConfiguration:
         if not self._is_valid_hex_color(value):
             raise ValueError("default_secondary must be a valid hex color (e.g., '#305b82')")
         self._default_secondary = value
+        self._default_secondary_rgb = _hex_to_rgb(value)
         if self._settings:
             self._settings.set_string('default-secondary', value)
 
@@ -166,6 +200,7 @@ class PluginConfiguration:
         if not self._is_valid_hex_color(value):
             raise ValueError("default_background must be a valid hex color (e.g., '#04040a')")
         self._default_background = value
+        self._default_background_rgb = _hex_to_rgb(value)
         if self._settings:
             self._settings.set_string('default-background', value)
 
@@ -179,6 +214,7 @@ class PluginConfiguration:
         if not self._is_valid_hex_color(value):
             raise ValueError("default_foreground must be a valid hex color (e.g., '#f0f0f0')")
         self._default_foreground = value
+        self._default_foreground_rgb = _hex_to_rgb(value)
         if self._settings:
             self._settings.set_string('default-foreground', value)
 
@@ -192,20 +228,36 @@ class PluginConfiguration:
         if not self._is_valid_hex_color(value):
             raise ValueError("default_accent must be a valid hex color (e.g., '#9e0d43')")
         self._default_accent = value
+        self._default_accent_rgb = _hex_to_rgb(value)
         if self._settings:
             self._settings.set_string('default-accent', value)
 
+    @property
+    def default_primary_rgb(self) -> tuple:
+        """Default primary color as a parsed (r, g, b) tuple."""
+        return self._default_primary_rgb
+
+    @property
+    def default_secondary_rgb(self) -> tuple:
+        """Default secondary color as a parsed (r, g, b) tuple."""
+        return self._default_secondary_rgb
+
+    @property
+    def default_background_rgb(self) -> tuple:
+        """Default background color as a parsed (r, g, b) tuple."""
+        return self._default_background_rgb
+
+    @property
+    def default_foreground_rgb(self) -> tuple:
+        """Default foreground color as a parsed (r, g, b) tuple."""
+        return self._default_foreground_rgb
+
+    @property
+    def default_accent_rgb(self) -> tuple:
+        """Default accent color as a parsed (r, g, b) tuple."""
+        return self._default_accent_rgb
+
     @staticmethod
     def _is_valid_hex_color(color: str) -> bool:
         """Validate hex color format."""
-        if not isinstance(color, str):
-            return False
-        if not color.startswith('#'):
-            return False
-        if len(color) != 7:
-            return False
-        try:
-            int(color[1:], 16)
-            return True
-        except ValueError:
-            return False
+        return isinstance(color, str) and _HEX_COLOR_FULLMATCH(color) is not None
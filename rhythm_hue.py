@@ -5,21 +5,94 @@ This module implements the Rhythmbox plugin interface and coordinates
 color extraction, caching, and theme application.
 """
 
-import hashlib
+import concurrent.futures
+import functools
 import logging
 import os
-import tempfile
-import urllib.parse
-from typing import Optional
-from gi.repository import GObject, Peas, PeasGtk, RB, Gtk, Gdk
-from color_extractor import ColorPalette, extract_colors_async, extract_colors_sync
+import time
+from typing import Optional, Union
+from gi.repository import GLib, GObject, Gio, Peas, PeasGtk, RB, Gtk, Gdk
+from color_extractor import (ColorPalette, extract_colors_async,
+                             extract_colors_async_from_bytes, extract_colors_sync)
 from theme_manager import ThemeManager
 from color_cache import ColorCache
 from config import PluginConfiguration
 
+# Optional dependency for embedded album art extraction, resolved once at
+# module load instead of on every song change
+try:
+    from mutagen import File as MutagenFile
+    _HAS_ART_DEPS = True
+except ImportError:
+    _HAS_ART_DEPS = False
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger('rhythmbox-dynamic-theme')
 
+# External cover art file names recognized next to the music file
+_COVER_NAMES = frozenset({
+    "cover.jpg", "cover.png", "folder.jpg", "folder.png",
+    "album.jpg", "album.png", "front.jpg", "front.png",
+})
+
+
+@functools.lru_cache(maxsize=256)
+def _scan_cover_dir(dir_path: str) -> Optional[str]:
+    """
+    Find an external cover art file in a directory, or None.
+
+    Memoized per directory: consecutive tracks from the same album folder
+    (the common case) resolve the cover with a dict lookup instead of
+    rescanning the directory. Cleared on plugin deactivation.
+    """
+    try:
+        with os.scandir(dir_path) as entries:
+            for dir_entry in entries:
+                if dir_entry.name.lower() in _COVER_NAMES and dir_entry.is_file():
+                    return dir_entry.path
+    except OSError:
+        pass
+    return None
+
+# RhythmDB property ids resolved once at import; every song change reads
+# several of these, and each RB.RhythmDBPropType.X access goes through the
+# GObject introspection enum machinery
+_PROP_TITLE = RB.RhythmDBPropType.TITLE
+_PROP_ARTIST = RB.RhythmDBPropType.ARTIST
+_PROP_ALBUM = RB.RhythmDBPropType.ALBUM
+_PROP_LOCATION = RB.RhythmDBPropType.LOCATION
+_PROP_MB_ALBUMID = RB.RhythmDBPropType.MUSICBRAINZ_ALBUMID
+_PROP_ALBUM_ARTIST = RB.RhythmDBPropType.ALBUM_ARTIST
+_PROP_DATE = RB.RhythmDBPropType.DATE
+
+
+# preferences.ui content, read once and kept for the life of the process so
+# reopening the dialog skips the disk read
+_preferences_ui_xml: Optional[str] = None
+
+
+def _load_preferences_ui() -> str:
+    """Return the preferences.ui XML, reading it from disk on first use."""
+    global _preferences_ui_xml
+    if _preferences_ui_xml is None:
+        plugin_dir = os.path.dirname(os.path.abspath(__file__))
+        with open(os.path.join(plugin_dir, 'preferences.ui')) as f:
+            _preferences_ui_xml = f.read()
+    return _preferences_ui_xml
+
+
+def _hex_to_rgba(hex_color: str) -> Gdk.RGBA:
+    """Parse a '#rrggbb' string into a Gdk.RGBA via GTK's C parser."""
+    rgba = Gdk.RGBA()
+    rgba.parse(hex_color)
+    return rgba
+
+
+def _rgba_to_hex(rgba: Gdk.RGBA) -> str:
+    """Format a Gdk.RGBA back to a '#rrggbb' string."""
+    return '#%02x%02x%02x' % (
+        int(rgba.red * 255), int(rgba.green * 255), int(rgba.blue * 255))
+
 
 class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
     """
@@ -38,10 +111,18 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
         self.theme_manager: Optional[ThemeManager] = None
         self.color_cache: Optional[ColorCache] = None
         self.player: Optional[RB.ShellPlayer] = None
-        self.signal_ids = []
+        self._connected_signals = []  # (gobject, handler_id) pairs to disconnect
         self.pending_extraction = False
         self.debounce_timer_id = None
-        self.temp_art_files = []  # Track temp files for cleanup
+        self._pending_entry: Optional[RB.RhythmDBEntry] = None  # Latest entry awaiting debounce
+        self._debounce_ms = 300  # Recomputed from config on activation
+        self._last_song_change = 0.0  # Monotonic time of the latest signal
+        self._debounce_deadline = 0.0  # Latest monotonic time processing may wait until
+        self._default_palette_cache: Optional[ColorPalette] = None
+        self._default_palette_sig = None  # Config values the cached palette was built from
+        self._art_executor: Optional[concurrent.futures.ThreadPoolExecutor] = None
+        self._song_generation = 0  # Bumped per processed song to drop stale worker results
+        self._current_cache_key = None  # Key of the palette currently applied
 
         logger.info("RhythmHuePlugin instance created")
 
@@ -64,13 +145,26 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
             cache_size = self.config.cache_size
             self.color_cache = ColorCache(max_size=cache_size)
 
+            # Convert the configured debounce delay to milliseconds once
+            # rather than on every song-changed signal
+            self._debounce_ms = int(self.config.debounce_delay * 1000)
+
+            # Single worker for album art I/O so track changes never block
+            # the GTK main loop on disk reads
+            self._art_executor = concurrent.futures.ThreadPoolExecutor(
+                max_workers=1, thread_name_prefix='rhythm-hue-art')
+
             # Get Rhythmbox shell and player
             shell = self.object
             self.player = shell.props.shell_player
 
-            # Connect to player signals
+            # Let the theme manager skip gradient restyles when hidden
+            self.theme_manager.main_window = shell.props.window
+
+            # Connect to player signals, remembering which object each
+            # handler belongs to so deactivation disconnects the right one
             signal_id = self.player.connect('playing-song-changed', self.on_playing_song_changed)
-            self.signal_ids.append(signal_id)
+            self._connected_signals.append((self.player, signal_id))
 
             logger.info("Rhythmbox Dynamic Theme plugin activated successfully")
 
@@ -78,7 +172,7 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
             self.apply_theme_to_current_song()
 
         except Exception as e:
-            logger.error(f"Error activating plugin: {e}", exc_info=True)
+            logger.error("Error activating plugin: %s", e, exc_info=True)
 
     def do_deactivate(self) -> None:
         """
@@ -93,28 +187,34 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
             if self.debounce_timer_id is not None:
                 GObject.source_remove(self.debounce_timer_id)
                 self.debounce_timer_id = None
+            self._pending_entry = None
 
-            # Disconnect all signals
-            if self.player:
-                for signal_id in self.signal_ids:
-                    self.player.disconnect(signal_id)
-            self.signal_ids.clear()
+            # Stop the album art worker; queued lookups and extractions that
+            # have not started yet are cancelled outright
+            self._song_generation += 1
+            if self._art_executor is not None:
+                self._art_executor.shutdown(wait=False, cancel_futures=True)
+                self._art_executor = None
+
+            # Disconnect all signals from their owning objects
+            for obj, signal_id in self._connected_signals:
+                if obj.handler_is_connected(signal_id):
+                    obj.handler_disconnect(signal_id)
+            self._connected_signals.clear()
 
             # Remove theme
             if self.theme_manager:
                 self.theme_manager.remove_theme()
 
-            # Clear cache
+            # Clear caches
             if self.color_cache:
                 self.color_cache.clear()
-
-            # Clean up temp files
-            self._cleanup_temp_files()
+            _scan_cover_dir.cache_clear()
 
             logger.info("Rhythmbox Dynamic Theme plugin deactivated successfully")
 
         except Exception as e:
-            logger.error(f"Error deactivating plugin: {e}", exc_info=True)
+            logger.error("Error deactivating plugin: %s", e, exc_info=True)
 
     def on_playing_song_changed(self, player: RB.ShellPlayer, entry: RB.RhythmDBEntry) -> None:
         """
@@ -125,25 +225,88 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
             entry: New playing song entry (or None if stopped)
         """
         try:
-            # Cancel any pending debounce timer
-            if self.debounce_timer_id is not None:
-                GObject.source_remove(self.debounce_timer_id)
-                self.debounce_timer_id = None
-
             if entry is None:
+                # Cancel any pending debounce timer
+                if self.debounce_timer_id is not None:
+                    GObject.source_remove(self.debounce_timer_id)
+                    self.debounce_timer_id = None
+                self._pending_entry = None
+
+                # Invalidate any in-flight album art lookup
+                self._song_generation += 1
+
                 logger.info("Playback stopped, applying default theme")
                 self._apply_default_theme()
                 return
 
-            # Debounce rapid song changes
-            debounce_delay = int(self.config.debounce_delay * 1000)  # Convert to milliseconds
+            # Consecutive tracks from the same album are the dominant event
+            # and map to the palette already on screen - skip the debounce
+            # and the whole processing pipeline outright. This newest signal
+            # supersedes anything still waiting in the debounce window and
+            # any extraction already running for a superseded track, so drop
+            # the pending entry and invalidate in-flight work too or their
+            # stale theme would be applied over the correct one
+            if (self._current_cache_key is not None
+                    and self._generate_cache_key(entry) == self._current_cache_key
+                    and self.theme_manager.is_active):
+                if self.debounce_timer_id is not None:
+                    GObject.source_remove(self.debounce_timer_id)
+                    self.debounce_timer_id = None
+                self._pending_entry = None
+                self._song_generation += 1
+                logger.debug("Same album as current theme, skipping")
+                return
+
+            # Debounce rapid song changes: remember only the latest entry and
+            # keep a single timer alive instead of remove+add per signal.
+            # Processing happens once the signals go quiet for the debounce
+            # delay, or at the deadline if they never do, so a seek/scan
+            # burst collapses to one extraction with bounded latency
+            self._pending_entry = entry
+            self._last_song_change = time.monotonic()
+            if self.debounce_timer_id is None:
+                self._debounce_deadline = self._last_song_change + 2 * self._debounce_ms / 1000.0
+                self.debounce_timer_id = GObject.timeout_add(
+                    self._debounce_ms,
+                    self._on_debounce_timeout
+                )
+
+        except Exception as e:
+            # Traceback formatting walks frames and reads source from disk,
+            # so only pay for it when debug logging is on
+            logger.error("Error handling song change: %s", e)
+            logger.debug("Song change error traceback:", exc_info=True)
+
+    def _on_debounce_timeout(self) -> bool:
+        """
+        Debounce timer callback: process the most recent pending entry.
+
+        Fires on the trailing edge - if more signals arrived while waiting,
+        the wait is extended until they stop, but never past the deadline
+        set when the burst started.
+        """
+        now = time.monotonic()
+        quiet_ms = (now - self._last_song_change) * 1000.0
+
+        if quiet_ms < self._debounce_ms and now < self._debounce_deadline:
+            # Still mid-burst: wait out the remaining quiet period (capped
+            # at the deadline) with a fresh one-shot timer
+            remaining_ms = min(self._debounce_ms - quiet_ms,
+                               (self._debounce_deadline - now) * 1000.0)
             self.debounce_timer_id = GObject.timeout_add(
-                debounce_delay,
-                lambda: self._process_song_change(entry) or False
+                max(int(remaining_ms), 10),
+                self._on_debounce_timeout
             )
+            return False
 
-        except Exception as e:
-            logger.error(f"Error handling song change: {e}", exc_info=True)
+        self.debounce_timer_id = None
+        entry = self._pending_entry
+        self._pending_entry = None
+
+        if entry is not None:
+            self._process_song_change(entry)
+
+        return False  # One-shot timer
 
     def _process_song_change(self, entry: RB.RhythmDBEntry) -> None:
         """
@@ -153,107 +316,183 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
             entry: RhythmDBEntry for the new song
         """
         try:
-            self.debounce_timer_id = None
-
             # Extract song metadata
-            title = entry.get_string(RB.RhythmDBPropType.TITLE)
-            artist = entry.get_string(RB.RhythmDBPropType.ARTIST)
-            album = entry.get_string(RB.RhythmDBPropType.ALBUM)
-
-            logger.info(f"Processing song: {title} by {artist} (album: {album})")
-
-            # Extract album art from music file first
-            album_art_path = self._extract_album_art(entry)
-
-            if album_art_path and os.path.exists(album_art_path):
-                # Generate cache key from album + artist
-                cache_key = self._generate_cache_key(album, artist)
-
-                # Check cache for this album art
-                cached_palette = self.color_cache.get(cache_key)
-                if cached_palette:
-                    logger.info("Using cached palette")
-                    self.theme_manager.apply_theme(cached_palette)
-                    return
-                logger.info(f"Extracting colors from: {album_art_path}")
+            title = entry.get_string(_PROP_TITLE)
+            artist = entry.get_string(_PROP_ARTIST)
+            album = entry.get_string(_PROP_ALBUM)
+
+            logger.info("Processing song: %s by %s (album: %s)", title, artist, album)
+
+            # Check the cache before touching the filesystem: on a hit (the
+            # steady state while playing through an album) all the art
+            # probing and mutagen parsing below is skipped entirely
+            cache_key = self._generate_cache_key(entry)
+            cached_palette = self.color_cache.get(cache_key)
+            if cached_palette:
+                # Invalidate any in-flight extraction for a superseded track
+                # so its late completion cannot overwrite this theme
+                self._song_generation += 1
+                logger.info("Using cached palette")
+                self.theme_manager.apply_theme(cached_palette)
+                self._current_cache_key = cache_key
+                return
+
+            # Extract album art on the worker thread; results are marshalled
+            # back to the main loop and matched against the generation
+            # counter so completions for superseded tracks are dropped
+            self._song_generation += 1
+            generation = self._song_generation
+
+            if self._art_executor is None:
+                logger.debug("Art executor not available, skipping extraction")
+                self._apply_default_theme()
+                return
+
+            # Fetch the location here so the worker never touches the
+            # RhythmDB entry from another thread
+            location = entry.get_string(_PROP_LOCATION)
+            future = self._art_executor.submit(self._extract_album_art, location)
+
+            def on_art_done(fut, generation=generation, key=cache_key):
+                GLib.idle_add(self._on_album_art_ready, fut, generation, key)
+
+            future.add_done_callback(on_art_done)
+
+        except Exception as e:
+            logger.error("Error processing song change: %s", e)
+            logger.debug("Song processing error traceback:", exc_info=True)
+            self._apply_default_theme()
+
+    def _on_album_art_ready(self, future, generation: int, cache_key) -> bool:
+        """
+        Main-loop continuation once album art lookup finishes.
+
+        Args:
+            future: Completed future holding the album art path (or None)
+            generation: Song generation the lookup was started for
+            cache_key: Cache key computed for that song
+
+        Returns:
+            False to remove the idle source
+        """
+        try:
+            # A newer song superseded this lookup while it was in flight
+            if generation != self._song_generation:
+                logger.debug("Discarding stale album art result")
+                return False
+
+            album_art = future.result()
+
+            if album_art:
                 self.pending_extraction = True
 
                 # Extract colors asynchronously
                 # Capture cache_key in closure for callback
-                def on_extraction_complete(palette: Optional[ColorPalette], key=cache_key):
+                def on_extraction_complete(palette: Optional[ColorPalette],
+                                           key=cache_key, gen=generation):
                     self.pending_extraction = False
 
+                    # Another song started while extraction was running
+                    if gen != self._song_generation:
+                        logger.debug("Discarding stale extraction result")
+                        return
+
                     if palette:
                         # Cache the palette
                         self.color_cache.put(key, palette)
 
                         # Apply theme
                         self.theme_manager.apply_theme(palette)
+                        self._current_cache_key = key
                         logger.info("Theme applied from extracted colors")
                     else:
                         # Extraction failed, use default
                         logger.warning("Color extraction failed, using default theme")
                         self._apply_default_theme()
 
-                extract_colors_async(album_art_path, on_extraction_complete)
+                # Embedded art arrives as raw bytes, external covers as a path
+                if isinstance(album_art, bytes):
+                    logger.info("Extracting colors from embedded album art")
+                    extract_colors_async_from_bytes(album_art, on_extraction_complete,
+                                                    executor=self._art_executor)
+                else:
+                    logger.info("Extracting colors from: %s", album_art)
+                    extract_colors_async(album_art, on_extraction_complete,
+                                         executor=self._art_executor)
             else:
                 logger.info("No album art found, using default theme")
                 self._apply_default_theme()
 
         except Exception as e:
-            logger.error(f"Error processing song change: {e}", exc_info=True)
+            logger.error("Error processing album art result: %s", e)
+            logger.debug("Album art result error traceback:", exc_info=True)
             self._apply_default_theme()
 
-    def _generate_cache_key(self, album: str, artist: str) -> str:
+        return False
+
+    def _generate_cache_key(self, entry: RB.RhythmDBEntry):
         """
-        Generate cache key from album and artist.
+        Generate cache key for an entry's album.
+
+        Prefers the MusicBrainz album id, which uniquely identifies the
+        release; otherwise falls back to a tuple of album, artist, album
+        artist and release date, so two same-named albums (reissues,
+        compilations by various artists) do not share a palette. Both are
+        plain hashable keys, so no digest is computed per song change.
 
         Args:
-            album: Album name
-            artist: Artist name
+            entry: RhythmDBEntry for the playing song
 
         Returns:
-            MD5 hash of album+artist
+            Hashable cache key (string or tuple)
         """
-        key_str = f"{album or 'unknown'}-{artist or 'unknown'}"
-        return hashlib.md5(key_str.encode()).hexdigest()
+        mb_album_id = entry.get_string(_PROP_MB_ALBUMID)
+        if mb_album_id:
+            return mb_album_id
+
+        return (entry.get_string(_PROP_ALBUM) or '',
+                entry.get_string(_PROP_ARTIST) or '',
+                entry.get_string(_PROP_ALBUM_ARTIST) or '',
+                entry.get_ulong(_PROP_DATE))
 
-    def _extract_album_art(self, entry: RB.RhythmDBEntry) -> Optional[str]:
+    def _extract_album_art(self, location: Optional[str]) -> Union[str, bytes, None]:
         """
         Extract album art from music file's embedded metadata.
 
         Args:
-            entry: RhythmDBEntry
+            location: URI of the music file, as read from the entry
 
         Returns:
-            Path to extracted album art image, or None if not found
+            Path to an external cover art file, the raw bytes of embedded
+            art, or None if not found
         """
         try:
-            # Get the music file location
-            location = entry.get_string(RB.RhythmDBPropType.LOCATION)
             if not location:
                 return None
 
-            file_path = urllib.parse.unquote(location.replace("file://", ""))
+            # Decode the URI via Gio's C implementation (handles host parts
+            # and escapes correctly); percent-free URIs take the cheap path
+            if location.startswith("file://") and '%' not in location:
+                file_path = location[7:]
+            else:
+                file_path = Gio.File.new_for_uri(location).get_path()
+                if file_path is None:
+                    logger.debug("Not a local file URI: %s", location)
+                    return None
+
             if not os.path.exists(file_path):
-                logger.debug(f"Music file not found: {file_path}")
+                logger.debug("Music file not found: %s", file_path)
                 return None
 
             # First check for external album art files in the same directory
-            dir_path = os.path.dirname(file_path)
-            for cover_name in ["cover.jpg", "cover.png", "folder.jpg", "folder.png",
-                               "album.jpg", "album.png", "front.jpg", "front.png"]:
-                cover_path = os.path.join(dir_path, cover_name)
-                if os.path.exists(cover_path):
-                    logger.info(f"Found external cover art: {cover_path}")
-                    return cover_path
+            # (memoized per directory, see _scan_cover_dir)
+            cover_path = _scan_cover_dir(os.path.dirname(file_path))
+            if cover_path is not None:
+                logger.info("Found external cover art: %s", cover_path)
+                return cover_path
 
             # Try to extract embedded album art
-            try:
-                from mutagen import File as MutagenFile
-                from PIL import Image
-                import io
-            except ImportError:
+            if not _HAS_ART_DEPS:
                 logger.debug("mutagen or PIL not available for embedded art extraction")
                 return None
 
@@ -273,67 +512,59 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
                 image_data = bytes(audio.tags['covr'][0])
                 logger.debug("Extracted album art from MP4/M4A covr tag")
 
-            # MP3 files with ID3 tags - check for APIC frames
-            elif hasattr(audio, 'tags') and audio.tags:
-                for key in audio.tags.keys():
-                    if key.startswith('APIC'):
-                        image_data = audio.tags[key].data
-                        logger.debug("Extracted album art from MP3 APIC tag")
-                        break
+            # MP3 files with ID3 tags - ID3 indexes APIC frames directly, so
+            # ask for them instead of scanning every frame key
+            elif hasattr(audio, 'tags') and audio.tags and hasattr(audio.tags, 'getall'):
+                apic_frames = audio.tags.getall('APIC')
+                if apic_frames:
+                    image_data = apic_frames[0].data
+                    logger.debug("Extracted album art from MP3 APIC tag")
 
             if image_data:
-                # Validate and save to temp file
-                try:
-                    img = Image.open(io.BytesIO(image_data))
-                    img.verify()
-
-                    # Create temp file
-                    temp_fd, temp_path = tempfile.mkstemp(suffix='.jpg', prefix='rhythmbox-dynamic-theme-')
-                    os.close(temp_fd)
-
-                    # Re-open and save
-                    img = Image.open(io.BytesIO(image_data))
-                    img = img.convert('RGB')
-                    img.save(temp_path, 'JPEG', quality=90)
-
-                    self.temp_art_files.append(temp_path)
-                    logger.info(f"Extracted embedded album art to {temp_path}")
-                    return temp_path
-
-                except Exception as e:
-                    logger.debug(f"Failed to process embedded image: {e}")
-                    return None
+                # Hand the raw bytes straight to the color extractor; writing
+                # them to a temp file just to re-open and decode them again
+                # was pure waste, and validation happens on decode anyway
+                logger.info("Extracted embedded album art (%d bytes)", len(image_data))
+                return bytes(image_data)
 
             logger.debug("No album art found in music file")
             return None
 
         except Exception as e:
-            logger.error(f"Error extracting album art: {e}", exc_info=True)
+            logger.error("Error extracting album art: %s", e)
+            logger.debug("Album art extraction error traceback:", exc_info=True)
             return None
 
     def _apply_default_theme(self) -> None:
         """Apply default fallback theme when album art is missing."""
         try:
-            # Create default palette from config
-            def hex_to_rgb(hex_color: str):
-                hex_color = hex_color.lstrip('#')
-                return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
-
-            default_palette = ColorPalette(
-                primary=hex_to_rgb(self.config.default_primary),
-                secondary=hex_to_rgb(self.config.default_secondary),
-                background=hex_to_rgb(self.config.default_background),
-                foreground=hex_to_rgb(self.config.default_foreground),
-                accent=hex_to_rgb(self.config.default_accent),
-                contrast_ratio_bg_fg=12.0,  # Default colors are pre-validated
-                source_hash="default"
-            )
-
-            self.theme_manager.apply_theme(default_palette)
+            # Rebuild the default palette only when the configured colors
+            # change; stop/no-art events otherwise reuse the cached object
+            sig = (self.config.default_primary, self.config.default_secondary,
+                   self.config.default_background, self.config.default_foreground,
+                   self.config.default_accent)
+
+            if self._default_palette_cache is None or sig != self._default_palette_sig:
+                # The configuration parses its hex strings once and exposes
+                # the (r, g, b) tuples directly, so no parsing happens here
+                self._default_palette_cache = ColorPalette(
+                    primary=self.config.default_primary_rgb,
+                    secondary=self.config.default_secondary_rgb,
+                    background=self.config.default_background_rgb,
+                    foreground=self.config.default_foreground_rgb,
+                    accent=self.config.default_accent_rgb,
+                    contrast_ratio_bg_fg=12.0,  # Default colors are pre-validated
+                    source_hash="default"
+                )
+                self._default_palette_sig = sig
+
+            self.theme_manager.apply_theme(self._default_palette_cache)
+            self._current_cache_key = None
             logger.info("Default theme applied")
 
         except Exception as e:
-            logger.error(f"Error applying default theme: {e}", exc_info=True)
+            logger.error("Error applying default theme: %s", e)
+            logger.debug("Default theme error traceback:", exc_info=True)
 
     def apply_theme_to_current_song(self) -> None:
         """Apply theme to currently playing song (called on activation)."""
@@ -348,18 +579,7 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
                     self._apply_default_theme()
 
         except Exception as e:
-            logger.error(f"Error applying theme to current song: {e}", exc_info=True)
-
-    def _cleanup_temp_files(self):
-        """Clean up temporary album art files."""
-        for temp_file in self.temp_art_files:
-            try:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-                    logger.debug(f"Cleaned up temp file: {temp_file}")
-            except Exception as e:
-                logger.debug(f"Error cleaning up {temp_file}: {e}")
-        self.temp_art_files.clear()
+            logger.error("Error applying theme to current song: %s", e, exc_info=True)
 
     def do_create_configure_widget(self):
         """
@@ -376,138 +596,46 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
             if self.config is None:
                 self.config = PluginConfiguration()
 
-            # Get the directory where the plugin is located
-            plugin_dir = os.path.dirname(os.path.abspath(__file__))
-            ui_file = os.path.join(plugin_dir, 'preferences.ui')
-
-            # Load the UI file
+            # Build the widgets from the cached UI definition
             builder = Gtk.Builder()
-            builder.add_from_file(ui_file)
+            builder.add_from_string(_load_preferences_ui())
 
             # Get the main container
             preferences_box = builder.get_object('preferences_box')
 
-            # Get color buttons
-            primary_button = builder.get_object('primary_color_button')
-            secondary_button = builder.get_object('secondary_color_button')
-            background_button = builder.get_object('background_color_button')
-            foreground_button = builder.get_object('foreground_color_button')
-            accent_button = builder.get_object('accent_color_button')
-
-            # Get reset buttons and restart bar
-            reset_primary_button = builder.get_object('reset_primary_button')
-            reset_secondary_button = builder.get_object('reset_secondary_button')
-            reset_background_button = builder.get_object('reset_background_button')
-            reset_foreground_button = builder.get_object('reset_foreground_button')
-            reset_accent_button = builder.get_object('reset_accent_button')
             restart_bar = builder.get_object('restart_bar')
             restart_app_button = builder.get_object('restart_app_button')
 
-            # Helper function to convert hex to Gdk.RGBA
-            def hex_to_rgba(hex_color):
-                hex_color = hex_color.lstrip('#')
-                r = int(hex_color[0:2], 16) / 255.0
-                g = int(hex_color[2:4], 16) / 255.0
-                b = int(hex_color[4:6], 16) / 255.0
-                rgba = Gdk.RGBA()
-                rgba.red = r
-                rgba.green = g
-                rgba.blue = b
-                rgba.alpha = 1.0
-                return rgba
-
-            # Helper function to convert Gdk.RGBA to hex
-            def rgba_to_hex(rgba):
-                r = int(rgba.red * 255)
-                g = int(rgba.green * 255)
-                b = int(rgba.blue * 255)
-                return f'#{r:02x}{g:02x}{b:02x}'
-
-            # Set initial colors
-            primary_button.set_rgba(hex_to_rgba(self.config.default_primary))
-            secondary_button.set_rgba(hex_to_rgba(self.config.default_secondary))
-            background_button.set_rgba(hex_to_rgba(self.config.default_background))
-            foreground_button.set_rgba(hex_to_rgba(self.config.default_foreground))
-            accent_button.set_rgba(hex_to_rgba(self.config.default_accent))
-
-            # Connect color change handlers
-            def on_primary_color_set(button):
-                rgba = button.get_rgba()
-                self.config.default_primary = rgba_to_hex(rgba)
-                restart_bar.set_visible(True)
-                logger.info(f"Primary color changed to: {self.config.default_primary}")
-
-            def on_secondary_color_set(button):
-                rgba = button.get_rgba()
-                self.config.default_secondary = rgba_to_hex(rgba)
-                restart_bar.set_visible(True)
-                logger.info(f"Secondary color changed to: {self.config.default_secondary}")
-
-            def on_background_color_set(button):
-                rgba = button.get_rgba()
-                self.config.default_background = rgba_to_hex(rgba)
-                restart_bar.set_visible(True)
-                logger.info(f"Background color changed to: {self.config.default_background}")
-
-            def on_foreground_color_set(button):
-                rgba = button.get_rgba()
-                self.config.default_foreground = rgba_to_hex(rgba)
-                restart_bar.set_visible(True)
-                logger.info(f"Foreground color changed to: {self.config.default_foreground}")
-
-            def on_accent_color_set(button):
-                rgba = button.get_rgba()
-                self.config.default_accent = rgba_to_hex(rgba)
-                restart_bar.set_visible(True)
-                logger.info(f"Accent color changed to: {self.config.default_accent}")
-
-            primary_button.connect('color-set', on_primary_color_set)
-            secondary_button.connect('color-set', on_secondary_color_set)
-            background_button.connect('color-set', on_background_color_set)
-            foreground_button.connect('color-set', on_foreground_color_set)
-            accent_button.connect('color-set', on_accent_color_set)
-
-            # Connect individual reset button handlers
-            def on_reset_primary_clicked(button):
-                default_color = '#9e0d43'
-                self.config.default_primary = default_color
-                primary_button.set_rgba(hex_to_rgba(default_color))
-                restart_bar.set_visible(True)
-                logger.info(f"Primary color reset to default: {default_color}")
-
-            def on_reset_secondary_clicked(button):
-                default_color = '#305b82'
-                self.config.default_secondary = default_color
-                secondary_button.set_rgba(hex_to_rgba(default_color))
-                restart_bar.set_visible(True)
-                logger.info(f"Secondary color reset to default: {default_color}")
-
-            def on_reset_background_clicked(button):
-                default_color = '#04040a'
-                self.config.default_background = default_color
-                background_button.set_rgba(hex_to_rgba(default_color))
-                restart_bar.set_visible(True)
-                logger.info(f"Background color reset to default: {default_color}")
-
-            def on_reset_foreground_clicked(button):
-                default_color = '#f0f0f0'
-                self.config.default_foreground = default_color
-                foreground_button.set_rgba(hex_to_rgba(default_color))
-                restart_bar.set_visible(True)
-                logger.info(f"Foreground color reset to default: {default_color}")
-
-            def on_reset_accent_clicked(button):
-                default_color = '#9e0d43'
-                self.config.default_accent = default_color
-                accent_button.set_rgba(hex_to_rgba(default_color))
-                restart_bar.set_visible(True)
-                logger.info(f"Accent color reset to default: {default_color}")
-
-            reset_primary_button.connect('clicked', on_reset_primary_clicked)
-            reset_secondary_button.connect('clicked', on_reset_secondary_clicked)
-            reset_background_button.connect('clicked', on_reset_background_clicked)
-            reset_foreground_button.connect('clicked', on_reset_foreground_clicked)
-            reset_accent_button.connect('clicked', on_reset_accent_clicked)
+            # One pair of handler factories covers all five colors; the
+            # per-color closures only differed in which config attribute
+            # and buttons they touched
+            def make_color_set_handler(attr):
+                def on_color_set(button):
+                    setattr(self.config, attr, _rgba_to_hex(button.get_rgba()))
+                    restart_bar.set_visible(True)
+                    logger.info("%s changed to: %s", attr, getattr(self.config, attr))
+                return on_color_set
+
+            def make_reset_handler(attr, default_color, color_button):
+                def on_reset_clicked(button):
+                    setattr(self.config, attr, default_color)
+                    color_button.set_rgba(_hex_to_rgba(default_color))
+                    restart_bar.set_visible(True)
+                    logger.info("%s reset to default: %s", attr, default_color)
+                return on_reset_clicked
+
+            # Wire up each color row, with hardcoded fallbacks taken from
+            # the configuration's key table
+            for key, fallback in PluginConfiguration.DEFAULT_COLOR_KEYS:
+                attr = key.replace('-', '_')  # e.g. 'default-primary' -> 'default_primary'
+                name = key[len('default-'):]
+
+                color_button = builder.get_object(f'{name}_color_button')
+                reset_button = builder.get_object(f'reset_{name}_button')
+
+                color_button.set_rgba(_hex_to_rgba(getattr(self.config, attr)))
+                color_button.connect('color-set', make_color_set_handler(attr))
+                reset_button.connect('clicked', make_reset_handler(attr, fallback, color_button))
 
             # Connect restart button handler
             def on_restart_clicked(button):
@@ -523,7 +651,7 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
                     else:
                         logger.error("Could not find rhythmbox executable")
                 except Exception as e:
-                    logger.error(f"Error restarting Rhythmbox: {e}", exc_info=True)
+                    logger.error("Error restarting Rhythmbox: %s", e, exc_info=True)
 
             restart_app_button.connect('clicked', on_restart_clicked)
 
@@ -531,7 +659,7 @@ class RhythmHuePlugin(GObject.Object, Peas.Activatable, PeasGtk.Configurable):
             return preferences_box
 
         except Exception as e:
-            logger.error(f"Error creating preferences widget: {e}", exc_info=True)
+            logger.error("Error creating preferences widget: %s", e, exc_info=True)
             error_label = Gtk.Label(label=f"Error loading preferences: {e}")
             error_label.show()
             return error_label
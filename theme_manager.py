@@ -6,6 +6,7 @@ This module handles CSS generation and application to Rhythmbox UI.
 
 import logging
 from typing import Optional
+import numpy as np
 from gi.repository import Gtk, Gdk, GLib
 from color_extractor import ColorPalette
 from config import PluginConfiguration
@@ -13,6 +14,58 @@ from config import PluginConfiguration
 logger = logging.getLogger('rhythm-hue.theme-manager')
 
 
+def _build_color_bundle(palette: ColorPalette) -> dict:
+    """
+    Format every palette-derived CSS color string in one pass.
+
+    Runs once per palette (template generation is already once-per-palette),
+    so none of this string math is repeated per gradient state or per
+    stylesheet section. All blends are computed unconditionally, so every
+    section can rely on its colors regardless of which UI toggles are on.
+    """
+    def rgb_to_css(rgb):
+        return f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"
+
+    def rgb_to_rgba(rgb, alpha):
+        return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
+
+    # All four solid blends in one vectorized lerp (mix=0 is pure base,
+    # mix=1 is pure other); uint8 truncation matches the previous int() casts
+    bases = np.array([palette.background, palette.background,
+                      palette.background, palette.primary], dtype=np.float64)
+    others = np.array([palette.primary, palette.secondary,
+                       palette.foreground, palette.foreground], dtype=np.float64)
+    mixes = np.array([0.3, 0.3, 0.15, 0.5])[:, None]
+    blends = (bases * (1.0 - mixes) + others * mixes).astype(np.uint8)
+    (blend_30, secondary_blend_30,
+     foreground_blend_15, foreground_primary_blend) = (
+        tuple(int(c) for c in row) for row in blends)
+
+    return {
+        # Base colors
+        'primary': rgb_to_css(palette.primary),
+        'secondary': rgb_to_css(palette.secondary),
+        'background': rgb_to_css(palette.background),
+        'foreground': rgb_to_css(palette.foreground),
+        'accent': rgb_to_css(palette.accent),
+
+        # Common color variations with opacity - reusable across CSS
+        'primary_5': rgb_to_rgba(palette.primary, 0.05),   # Very subtle background
+        'primary_10': rgb_to_rgba(palette.primary, 0.1),   # Subtle background
+        'primary_15': rgb_to_rgba(palette.primary, 0.15),
+        'primary_20': rgb_to_rgba(palette.primary, 0.2),
+        'primary_30': rgb_to_rgba(palette.primary, 0.3),
+        'primary_50': rgb_to_rgba(palette.primary, 0.5),
+        'accent_30': rgb_to_rgba(palette.accent, 0.3),
+
+        # Solid RGB blends used by the gradient and progress bar
+        'blend_30': rgb_to_css(blend_30),
+        'secondary_blend_30': rgb_to_css(secondary_blend_30),
+        'foreground_blend_15': rgb_to_css(foreground_blend_15),
+        'foreground_primary_blend': rgb_to_css(foreground_primary_blend),
+    }
+
+
 class ThemeManager:
     """
     Manages GTK CSS theme application and transitions.
@@ -20,6 +73,25 @@ class ThemeManager:
     Generates dynamic CSS from color palettes and applies them to Rhythmbox UI.
     """
 
+    # Radial gradient positions cycled through via timer
+    GRADIENT_POSITIONS = (
+        "100% 100%",
+        "65% 100%",
+        "15% 84%",
+        "0% 55%",
+        "5% 5%",
+        "35% 0%",
+        "65% 0%",
+        "100% 20%",
+        "100% 80%",
+    )
+
+    # Positions pre-encoded for splicing into the byte-level CSS template
+    _POSITION_BYTES = tuple(p.encode('ascii') for p in GRADIENT_POSITIONS)
+
+    # Placeholder marking where the gradient position goes in the template
+    _POSITION_SLOT = "@GRADIENT_POSITION@"
+
     def __init__(self, config: PluginConfiguration):
         """
         Initialize theme manager.
@@ -29,10 +101,17 @@ class ThemeManager:
         """
         self.config = config
         self.css_provider: Optional[Gtk.CssProvider] = None
+        self._provider_registered = False  # Provider attached to the screen
         self.is_active = False
+        # Rhythmbox main window, set by the plugin on activation; used to
+        # skip gradient restyles while nothing is on screen
+        self.main_window: Optional[Gtk.Window] = None
         self.gradient_timer_id: Optional[int] = None
         self.current_gradient_state: int = 0
         self.current_palette: Optional[ColorPalette] = None
+        # Encoded CSS for each gradient state, built once per palette so the
+        # cycle timer never re-runs CSS generation
+        self._css_cache: Optional[list] = None
 
         logger.info("ThemeManager initialized")
 
@@ -45,6 +124,17 @@ class ThemeManager:
             transition: Whether to animate transition (default True)
         """
         try:
+            # Re-applying the palette that is already on screen (repeated
+            # stop events, consecutive same-album tracks) would regenerate
+            # CSS and restyle every widget for no visual change. Compare by
+            # value, not source_hash: the hash identifies where the colors
+            # came from (file path, or "default"), so re-rendered art at the
+            # same path and edited default colors produce a different palette
+            # under the same hash and must still be applied
+            if self.is_active and palette == self.current_palette:
+                logger.debug("Palette %s already applied, skipping", palette.source_hash)
+                return
+
             # Store palette for gradient cycling
             self.current_palette = palette
             self.current_gradient_state = 0
@@ -54,28 +144,44 @@ class ThemeManager:
                 GLib.source_remove(self.gradient_timer_id)
                 self.gradient_timer_id = None
 
-            # Generate CSS from palette
-            css = self.generate_css(palette)
+            # Generate and encode the stylesheet once with a placeholder
+            # where the gradient position goes, then splice each position in
+            # at the byte level; only ~20 characters differ between states,
+            # so one generation covers all of them and the timer callback
+            # never does any string building
+            template = self._generate_css_template(palette).encode('utf-8')
+            prefix, slot, suffix = template.partition(self._POSITION_SLOT.encode('ascii'))
+            if slot:
+                self._css_cache = [prefix + pos + suffix for pos in self._POSITION_BYTES]
+            else:
+                # Background theming disabled: no gradient, every state is
+                # the same stylesheet
+                self._css_cache = [template] * len(self.GRADIENT_POSITIONS)
 
             # Create or update CSS provider
             if self.css_provider is None:
                 self.css_provider = Gtk.CssProvider()
 
             # Load CSS
-            self.css_provider.load_from_data(css.encode('utf-8'))
+            self.css_provider.load_from_data(self._css_cache[0])
 
-            # Get default screen
-            screen = Gdk.Screen.get_default()
-            if screen is None:
-                logger.error("Could not get default screen")
-                return
-
-            # Apply to screen with user priority (higher than APPLICATION)
-            Gtk.StyleContext.add_provider_for_screen(
-                screen,
-                self.css_provider,
-                Gtk.STYLE_PROVIDER_PRIORITY_USER
-            )
+            # Attach the provider to the screen once; re-adding it forces a
+            # full style recalculation across every widget, whereas loading
+            # new data into an attached provider is an incremental update
+            if not self._provider_registered:
+                # Get default screen
+                screen = Gdk.Screen.get_default()
+                if screen is None:
+                    logger.error("Could not get default screen")
+                    return
+
+                # Apply to screen with user priority (higher than APPLICATION)
+                Gtk.StyleContext.add_provider_for_screen(
+                    screen,
+                    self.css_provider,
+                    Gtk.STYLE_PROVIDER_PRIORITY_USER
+                )
+                self._provider_registered = True
 
             self.is_active = True
 
@@ -85,7 +191,8 @@ class ThemeManager:
             logger.info(f"Theme applied successfully (transition={transition})")
 
         except Exception as e:
-            logger.error(f"Error applying theme: {e}", exc_info=True)
+            logger.error("Error applying theme: %s", e)
+            logger.debug("Theme apply error traceback:", exc_info=True)
 
     def remove_theme(self) -> None:
         """
@@ -106,8 +213,10 @@ class ThemeManager:
                     )
 
             self.css_provider = None
+            self._provider_registered = False
             self.is_active = False
             self.current_palette = None
+            self._css_cache = None
             logger.info("Theme removed successfully")
 
         except Exception as e:
@@ -124,53 +233,88 @@ class ThemeManager:
             return False
 
         # Cycle to next state (0, 1, 2,.. then back to 0)
-        self.current_gradient_state = (self.current_gradient_state + 1) % 9
+        self.current_gradient_state = (self.current_gradient_state + 1) % len(self.GRADIENT_POSITIONS)
 
         try:
-            # Regenerate CSS with new gradient state
-            css = self.generate_css(self.current_palette)
-
-            if self.css_provider is not None:
-                self.css_provider.load_from_data(css.encode('utf-8'))
+            # Reloading CSS invalidates GTK style caches and restyles every
+            # widget, which is wasted work while the window is hidden. The
+            # state above still advances, so the next visible tick picks up
+            # a fresh gradient position.
+            if not self._window_visible():
+                logger.debug("Window hidden, skipping gradient restyle")
+                return True
+
+            # Load the pre-encoded CSS for the new state; no string work here
+            if self.css_provider is not None and self._css_cache is not None:
+                self.css_provider.load_from_data(self._css_cache[self.current_gradient_state])
                 logger.debug(f"Gradient cycled to state {self.current_gradient_state}")
         except Exception as e:
-            logger.error(f"Error cycling gradient: {e}", exc_info=True)
+            logger.error("Error cycling gradient: %s", e)
+            logger.debug("Gradient cycle error traceback:", exc_info=True)
 
         return True  # Continue timer
 
-    def generate_css(self, palette: ColorPalette) -> str:
+    def _window_visible(self) -> bool:
+        """Whether the main window is mapped and not iconified."""
+        window = self.main_window
+        if window is None:
+            # No window reference available: assume visible
+            return True
+
+        if not window.get_mapped():
+            return False
+
+        gdk_window = window.get_window()
+        if gdk_window is not None and gdk_window.get_state() & Gdk.WindowState.ICONIFIED:
+            return False
+
+        return True
+
+    def generate_css(self, palette: ColorPalette, state: int = 0) -> str:
         """
         Generate CSS stylesheet from color palette.
 
         Args:
             palette: ColorPalette with colors
+            state: Gradient state index selecting the radial gradient position
 
         Returns:
             CSS stylesheet string
         """
-        # Convert RGB tuples to CSS format
-        def rgb_to_css(rgb):
-            return f"rgb({rgb[0]}, {rgb[1]}, {rgb[2]})"
+        return self._generate_css_template(palette).replace(
+            self._POSITION_SLOT, self.GRADIENT_POSITIONS[state])
 
-        def rgb_to_rgba(rgb, alpha):
-            return f"rgba({rgb[0]}, {rgb[1]}, {rgb[2]}, {alpha})"
+    def _generate_css_template(self, palette: ColorPalette) -> str:
+        """
+        Generate the CSS stylesheet with a placeholder gradient position.
 
-        # Base colors
-        primary = rgb_to_css(palette.primary)
-        secondary = rgb_to_css(palette.secondary)
-        background = rgb_to_css(palette.background)
-        foreground = rgb_to_css(palette.foreground)
-        accent = rgb_to_css(palette.accent)
+        The placeholder (_POSITION_SLOT) is spliced per gradient state by
+        apply_theme, so this only needs to run once per palette.
 
-        # Common color variations with opacity - reusable across CSS
-        primary_5 = rgb_to_rgba(palette.primary, 0.05)    # Very subtle background
-        primary_10 = rgb_to_rgba(palette.primary, 0.1)    # Subtle background
-        primary_15 = rgb_to_rgba(palette.primary, 0.15)   
-        primary_20 = rgb_to_rgba(palette.primary, 0.2)    
-        primary_30 = rgb_to_rgba(palette.primary, 0.3)    
-        primary_50 = rgb_to_rgba(palette.primary, 0.5)    
+        Args:
+            palette: ColorPalette with colors
 
-        accent_30 = rgb_to_rgba(palette.accent, 0.3)
+        Returns:
+            CSS stylesheet string containing _POSITION_SLOT
+        """
+        # All palette-derived color strings, formatted in one pass
+        bundle = _build_color_bundle(palette)
+        primary = bundle['primary']
+        secondary = bundle['secondary']
+        background = bundle['background']
+        foreground = bundle['foreground']
+        accent = bundle['accent']
+        primary_5 = bundle['primary_5']
+        primary_10 = bundle['primary_10']
+        primary_15 = bundle['primary_15']
+        primary_20 = bundle['primary_20']
+        primary_30 = bundle['primary_30']
+        primary_50 = bundle['primary_50']
+        accent_30 = bundle['accent_30']
+        blend_30 = bundle['blend_30']
+        secondary_blend_30 = bundle['secondary_blend_30']
+        foreground_blend_15 = bundle['foreground_blend_15']
+        foreground_primary_blend = bundle['foreground_primary_blend']
 
         # Get transition duration from config
         transition_duration = self.config.transition_duration
@@ -193,36 +337,8 @@ class ThemeManager:
             # Create gradient from background (darker) to primary (lighter/saturated)
             # Apply to top-level window only - all children will be transparent to show it through
 
-            # Create solid RGB blended colors (not RGBA with transparency)
-            # Blend background with primary at different intensities
-            def blend_colors(bg_rgb, pr_rgb, mix):
-                """Blend two colors: mix=0 is pure bg, mix=1 is pure primary"""
-                return rgb_to_css((
-                    int(bg_rgb[0] * (1 - mix) + pr_rgb[0] * mix),
-                    int(bg_rgb[1] * (1 - mix) + pr_rgb[1] * mix),
-                    int(bg_rgb[2] * (1 - mix) + pr_rgb[2] * mix)
-                ))
-
-            blend_30 = blend_colors(palette.background, palette.primary, 0.3)
-            secondary_blend_30 = blend_colors(palette.background, palette.secondary, 0.3)
-            foreground_blend_15 = blend_colors(palette.background, palette.foreground, 0.15)
-            foreground_primary_blend = blend_colors(palette.primary, palette.foreground, 0.5)
-
-            # Define radial gradient positions that will be cycled through via timer
-            gradient_positions = [
-                "100% 100%",
-                "65% 100%",
-                "15% 84%",
-                "0% 55%",
-                "5% 5%",
-                "35% 0%",
-                "65% 0%",
-                "100% 20%",
-                "100% 80%",   
-            ]
-
-            # Use current gradient position for this render
-            current_position = gradient_positions[self.current_gradient_state]
+            # Placeholder, replaced per gradient state by the caller
+            current_position = self._POSITION_SLOT
 
             css_parts.append(f"""
 /* Radial gradient with moving center - manually cycled via Python timer */